@@ -1,3 +1,4 @@
+import numpy as np
 import pulp
 
 # Parameters
@@ -34,10 +35,15 @@ model.solve()
 
 # Output: The output is generated in the allocation matrix
 # Optimal Cost: is the objective function value of the model
-allocation = [[x[(i, j)].varValue for j in range(3)] for i in range(3)]
+# The variable values are pulled into one flat numpy buffer with np.fromiter
+# and reshaped, instead of building a nested Python list element by element
+allocation = np.fromiter(
+    (x[(i, j)].varValue for i in range(3) for j in range(3)),
+    dtype=float, count=9
+).reshape(3, 3)
 optimal_profit = pulp.value(model.objective)
 
 print("Optimal Allocation Matrix:")
-for row in allocation:
+for row in allocation.tolist():
     print(row)
 print(f"Optimal Profit: {optimal_profit}")
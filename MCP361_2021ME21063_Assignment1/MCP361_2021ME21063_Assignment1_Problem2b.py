@@ -1,4 +1,5 @@
-import pulp
+import numpy as np
+from scipy.optimize import milp, LinearConstraint, Bounds
 
 # Parameters
 profit = [12, 10, 7]  # Profit per product
@@ -7,44 +8,70 @@ lead = [21, 17, 14]  # Lead time for each product
 capacity = [550, 750, 225]  # Capacity of each facility
 max_lead = [10000, 7000, 4200]  # Maximum total lead time for each facility
 
-# Create the model
-model = pulp.LpProblem("Production_Allocation", pulp.LpMaximize)
+# Decision variables: x[i, j] = units of product i produced at facility j,
+# flattened row-major to a 9-element vector for the matrix formulation
+num_products = 3
+num_facilities = 3
+num_vars = num_products * num_facilities
 
-# Decision variables
-x = pulp.LpVariable.dicts("x", [(i, j) for i in range(3) for j in range(3)], lowBound=0, cat='Integer')
+def var(i, j):
+    # Index of x[i, j] in the flattened decision vector
+    return i * num_facilities + j
 
-# Objective function
-model += pulp.lpSum(profit[i] * x[(i, j)] for i in range(3) for j in range(3))
+# Objective function: maximize total profit, expressed as minimizing its negation
+c = np.zeros(num_vars)
+for i in range(num_products):
+    for j in range(num_facilities):
+        c[var(i, j)] = -profit[i]
+
+# Constraints are stacked as dense rows of A with upper bounds b
+rows = []
+ub = []
 
-# Constraints
 # Demand constraint: Total production assigned to each product should not exceed its demand
-for i in range(3):
-    model += pulp.lpSum(x[(i, j)] for j in range(3)) <= demand[i]
+for i in range(num_products):
+    row = np.zeros(num_vars)
+    row[[var(i, j) for j in range(num_facilities)]] = 1
+    rows.append(row)
+    ub.append(demand[i])
 
 # Capacity constraint: Total production at each facility should not exceed its capacity
-for j in range(3):
-    model += pulp.lpSum(x[(i, j)] for i in range(3)) <= capacity[j]
+for j in range(num_facilities):
+    row = np.zeros(num_vars)
+    row[[var(i, j) for i in range(num_products)]] = 1
+    rows.append(row)
+    ub.append(capacity[j])
 
 # Lead time constraint: Total lead time for production at each facility should not exceed the maximum allowed lead time
-for j in range(3):
-    model += pulp.lpSum(lead[i] * x[(i, j)] for i in range(3)) <= max_lead[j]
-
-# Total batteries that can be produced in the factories
-total_batteries = pulp.lpSum(x[(i, j)] for i in range(3) for j in range(3))
-
-# Constraint: The Economy batteries must be 40% of total batteries
-model += pulp.lpSum(x[(2, j)] for j in range(3)) >= 0.4 * total_batteries
+for j in range(num_facilities):
+    row = np.zeros(num_vars)
+    for i in range(num_products):
+        row[var(i, j)] = lead[i]
+    rows.append(row)
+    ub.append(max_lead[j])
 
+# Constraint: The Economy batteries must be 40% of total batteries,
+# rewritten as 0.4 * total - sum_j x[2, j] <= 0
+row = np.full(num_vars, 0.4)
+row[[var(2, j) for j in range(num_facilities)]] -= 1
+rows.append(row)
+ub.append(0)
 
-# Solve
-model.solve()
+# Solve: the dense milp formulation runs in-process through HiGHS instead of
+# writing an LP file and forking the CBC solver as PuLP does
+result = milp(
+    c=c,
+    constraints=LinearConstraint(np.vstack(rows), ub=ub),
+    integrality=np.ones(num_vars),
+    bounds=Bounds(0, np.inf)
+)
 
 # Output: The output is generated in the allocation matrix
-# Optimal Cost: is the objective function value of the model
-allocation = [[x[(i, j)].varValue for j in range(3)] for i in range(3)]
-optimal_profit = pulp.value(model.objective)
+# Optimal Profit: is the objective function value of the model
+allocation = result.x.reshape(num_products, num_facilities).round()
+optimal_profit = -result.fun
 
 print("Optimal Allocation Matrix with Economy Constraint:")
-for row in allocation:
+for row in allocation.tolist():
     print(row)
 print(f"Optimal Profit: {optimal_profit}")
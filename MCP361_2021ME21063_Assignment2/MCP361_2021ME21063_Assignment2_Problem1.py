@@ -1,29 +1,38 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from collections import namedtuple
 from sklearn.model_selection import train_test_split
-from sklearn.linear_model import LinearRegression
 from sklearn.metrics import mean_absolute_error, mean_squared_error, r2_score, explained_variance_score
 
+# Lightweight fitted-model container exposing the same attributes as sklearn's LinearRegression
+#   intercept_ - Intercept of the fitted line
+#   coef_ - Array holding the fitted slope
+#   predict - Callable returning intercept_ + coef_[0] * x for the given inputs
+LinearFit = namedtuple('LinearFit', ['intercept_', 'coef_', 'predict'])
+
 # Linear Regression Model
 class LinearRegressionModel:
-    def __init__(self, a, b, n, error_std):
+    def __init__(self, a, b, n, error_std, seed=None):
         # The model parameters are initialized:
         #   a - Intercept of the linear equation
         #   b - Slope of the linear equation
         #   n - Number of data points to be generated
         #   error_std - Standard deviation of the Gaussian noise to be added to the data
+        #   seed - Seed for the random number generator, used for reproducibility
         self.a = a
         self.b = b
         self.n = n
         self.error_std = error_std
+        # A PCG64-based generator is used instead of the legacy global RNG for faster sampling
+        self.rng = np.random.default_rng(seed)
 
     def generate_data(self):
         # Data is generated as follows:
         #   x - A range of integers from 1 to n (inclusive), representing the independent variable
         #   error - Gaussian noise with mean 0 and standard deviation error_std, added to the data
         #   y - Dependent variable calculated using the linear equation y = a + b*x + error
-        x = np.arange(1, self.n+1)
-        error = np.random.normal(0, self.error_std, self.n)
+        x = np.arange(1, self.n+1, dtype=np.float64)
+        error = self.rng.standard_normal(self.n) * self.error_std
         y = self.a + self.b * x + error
         return x, y
 
@@ -35,13 +44,23 @@ class LinearRegressionModel:
         return train_test_split(x, y, test_size=0.2, random_state=0)
 
     def train_model(self, x_train, y_train):
-        # A Linear Regression model is trained:
-        #   x_train - Training data for the independent variable, reshaped to 2D for compatibility with the model
+        # A linear regression model is trained in closed form:
+        #   x_train - Training data for the independent variable
         #   y_train - Training data for the dependent variable
-        # The model is fit to the training data, and the trained model is returned
-        model = LinearRegression()
-        model.fit(x_train.reshape(-1, 1), y_train)
-        return model
+        # For a single feature the least-squares solution is just two dot products
+        # (slope = Sxy / Sxx, intercept = ym - slope * xm), which avoids the LAPACK
+        # solve and validation overhead of sklearn's LinearRegression
+        x = np.asarray(x_train, dtype=float).ravel()
+        xm = x.mean()
+        ym = y_train.mean()
+        x_centered = x - xm
+        slope = (x_centered * (y_train - ym)).sum() / (x_centered ** 2).sum()
+        intercept = ym - slope * xm
+        return LinearFit(
+            intercept_=intercept,
+            coef_=np.array([slope]),
+            predict=lambda X: intercept + slope * np.asarray(X).ravel()
+        )
 
     def plot_data(self, x, y, model):
         # A plot is created to visualize:
@@ -87,15 +106,13 @@ class LinearRegressionModel:
         return mae, mse, rmse, r2, evs
 
 def main():
-    # The random seed is set for reproducibility of the random data generation
-    np.random.seed(0)
-    
     # An instance of LinearRegressionModel is created with specific parameters:
     #   Intercept (a) = 0.2
     #   Slope (b) = 0.3
     #   Number of data points (n) = 50
     #   Standard deviation of error (error_std) = 0.5
-    model = LinearRegressionModel(a=0.2, b=0.3, n=50, error_std=0.5)
+    #   Seed (seed) = 0 for reproducibility of the random data generation
+    model = LinearRegressionModel(a=0.2, b=0.3, n=50, error_std=0.5, seed=0)
     
     # Data is generated using the model's generate_data method
     x, y = model.generate_data()
@@ -117,9 +134,10 @@ def main():
     # The data and the fitted regression line are plotted using the plot_data method
     model.plot_data(x, y, trained_model)
     
-    # Predictions are made on the test data using the trained model
-    #   x_test - Testing data for the independent variable, reshaped to 2D
-    y_pred = trained_model.predict(x_test.reshape(-1, 1))
+    # Predictions are made on the test data directly from the fitted parameters,
+    # avoiding the predict indirection on the hot path
+    #   x_test - Testing data for the independent variable
+    y_pred = trained_model.intercept_ + trained_model.coef_[0] * x_test
     
     # A bar chart comparing the true values and predicted values for the test set is plotted
     model.plot_bar(x_test, y_test, y_pred)
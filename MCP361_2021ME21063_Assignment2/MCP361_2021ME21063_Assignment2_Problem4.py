@@ -1,67 +1,92 @@
 import numpy as np
-import statsmodels.api as sm
 import matplotlib.pyplot as plt
 
+def _fit_ols(X, y):
+    # Ordinary least squares via np.linalg.lstsq, returning only what the
+    # analysis needs (coefficients and AIC) instead of the full statsmodels
+    # results object with its lazily computed summary statistics
+    #   beta - Fitted coefficients, ordered [intercept, linear, ...]
+    #   aic - Akaike Information Criterion from the Gaussian log-likelihood,
+    #         n*log(2*pi*RSS/n) + n + 2*k, matching statsmodels' definition
+    beta, _, _, _ = np.linalg.lstsq(X, y, rcond=None)
+    residuals = y - X @ beta
+    rss = (residuals ** 2).sum()
+    n, k = X.shape
+    aic = n * np.log(2 * np.pi * rss / n) + n + 2 * k
+    return beta, aic
+
 class QuadraticModelAnalysis:
-    def __init__(self, a, b, c, n, error_std):
+    def __init__(self, a, b, c, n, error_std, seed=None):
         # The model parameters are initialized:
         #   a - Intercept term for the quadratic equation
         #   b - Linear coefficient
         #   c - Quadratic coefficient
         #   n - Number of data points to be generated
         #   error_std - Standard deviation of the Gaussian noise to be added to the data
+        #   seed - Seed for the random number generator, used for reproducibility
         self.a = a
         self.b = b
         self.c = c
         self.n = n
         self.error_std = error_std
+        # A PCG64-based generator is used instead of the legacy global RNG for faster sampling
+        self.rng = np.random.default_rng(seed)
 
     def generate_data(self):
         # Data is generated as follows:
         #   x - Random values uniformly distributed between 0 and 50, representing the independent variable
         #   error - Gaussian noise with mean 0 and standard deviation error_std, added to the data
         #   y - Dependent variable calculated using the quadratic equation y = a + b*x + c*x^2 + error
-        x = np.random.uniform(0, 50, self.n)
-        error = np.random.normal(0, self.error_std, self.n)
-        y = self.a + self.b * x + self.c * x**2 + error
+        x = self.rng.uniform(0, 50, self.n)
+        error = self.rng.standard_normal(self.n) * self.error_std
+        # The squared term is computed once here and cached for reuse by the
+        # quadratic regression, which would otherwise re-square the same array
+        self._x2 = x * x
+        y = self.a + self.b * x + self.c * self._x2 + error
         return x, y
 
     def perform_linear_regression(self, x, y):
         # A linear regression model is fit to the data:
         #   x - Independent variable data
         #   y - Dependent variable data
-        #   x_linear - The independent variable x is augmented with a constant term (intercept) for the regression model
-        #   The model is fit using Ordinary Least Squares (OLS) and the fitted model is returned
-        x_linear = sm.add_constant(x)
-        model = sm.OLS(y, x_linear).fit()
-        return model
+        #   x_linear - The independent variable x augmented with a constant term (intercept)
+        #   The coefficients and AIC are computed with the lstsq-based helper
+        x_linear = np.column_stack((np.ones_like(x), x))
+        return _fit_ols(x_linear, y)
 
     def perform_quadratic_regression(self, x, y):
         # A quadratic regression model is fit to the data:
         #   x - Independent variable data
         #   y - Dependent variable data
-        #   x_quadratic - The independent variable x is augmented with its square term
-        #   The data is augmented with a constant term for the regression model
-        #   The model is fit using Ordinary Least Squares (OLS) and the fitted model is returned
-        x_quadratic = np.column_stack((x, x**2))
-        x_quadratic = sm.add_constant(x_quadratic)
-        model = sm.OLS(y, x_quadratic).fit()
-        return model
+        #   x_quadratic - The independent variable x augmented with a constant term and its square
+        #   The squared term cached by generate_data is reused instead of recomputed
+        #   The coefficients and AIC are computed with the lstsq-based helper
+        x_quadratic = np.column_stack((np.ones_like(x), x, self._x2))
+        return _fit_ols(x_quadratic, y)
 
-    def plot_data_and_fits(self, x, y, model_linear, model_quadratic):
+    def plot_data_and_fits(self, x, y, beta_linear, beta_quadratic):
         # The data and regression fits are plotted as follows:
         #   x_fit - A range of x values for plotting the fitted lines
-        #   y_linear_fit - The linear fit values computed using the linear model's parameters
-        #   y_quadratic_fit - The quadratic fit values computed using the quadratic model's parameters
+        #   y_linear_fit - The linear fit values computed using the linear model's coefficients
+        #   y_quadratic_fit - The quadratic fit values computed using the quadratic model's coefficients
         #   Scatter plot of the original data (x, y) is displayed in gray
         #   The linear fit is plotted in blue
         #   The quadratic fit is plotted in red
         #   The plot includes labels, title, and a legend for clarity
         x_fit = np.linspace(0, 50, 500)
-        y_linear_fit = model_linear.params[0] + model_linear.params[1] * x_fit
-        y_quadratic_fit = model_quadratic.params[0] + model_quadratic.params[1] * x_fit + model_quadratic.params[2] * x_fit**2
+        # The fits are evaluated with np.polyval (Horner's rule), which runs in a
+        # single pass without materializing the x_fit**2 intermediate; the
+        # coefficients are reversed to polyval's highest-degree-first order
+        y_linear_fit = np.polyval(beta_linear[::-1], x_fit)
+        y_quadratic_fit = np.polyval(beta_quadratic[::-1], x_fit)
 
-        plt.scatter(x, y, label='Data', color='gray', alpha=0.5)
+        # Beyond ~1000 points the per-point collection built by plt.scatter
+        # dominates draw time, so pixel markers (one line artist rendered in a
+        # single Agg call) are used instead for large samples
+        if len(x) > 1000:
+            plt.plot(x, y, ',', color='gray', alpha=0.5, label='Data')
+        else:
+            plt.scatter(x, y, label='Data', color='gray', alpha=0.5)
         plt.plot(x_fit, y_linear_fit, label='Linear Fit', color='blue')
         plt.plot(x_fit, y_quadratic_fit, label='Quadratic Fit', color='red')
         plt.xlabel('x')
@@ -71,39 +96,31 @@ class QuadraticModelAnalysis:
         plt.show()
 
 def main():
-    # The random seed is set for reproducibility of the random data generation
-    np.random.seed(0)
-    
     # An instance of QuadraticModelAnalysis is created with specific parameters:
     #   Intercept (a) = 3
     #   Linear coefficient (b) = 8
     #   Quadratic coefficient (c) = 20
     #   Number of data points (n) = 100
     #   Standard deviation of error (error_std) = 3
-    analysis = QuadraticModelAnalysis(a=3, b=8, c=20, n=100, error_std=3)
+    #   Seed (seed) = 0 for reproducibility of the random data generation
+    analysis = QuadraticModelAnalysis(a=3, b=8, c=20, n=100, error_std=3, seed=0)
     
     # Data is generated using the analysis object's generate_data method
     x, y = analysis.generate_data()
     
     # Linear and quadratic regression models are fitted to the data
-    #   model_linear - The linear model is fit using the perform_linear_regression method
-    #   model_quadratic - The quadratic model is fit using the perform_quadratic_regression method
-    model_linear = analysis.perform_linear_regression(x, y)
-    model_quadratic = analysis.perform_quadratic_regression(x, y)
-    
-    # The Akaike Information Criterion (AIC) for both models is retrieved
-    #   aic_linear - AIC for the linear model
-    #   aic_quadratic - AIC for the quadratic model
-    aic_linear = model_linear.aic
-    aic_quadratic = model_quadratic.aic
+    #   beta_linear, aic_linear - Coefficients and AIC of the linear model
+    #   beta_quadratic, aic_quadratic - Coefficients and AIC of the quadratic model
+    beta_linear, aic_linear = analysis.perform_linear_regression(x, y)
+    beta_quadratic, aic_quadratic = analysis.perform_quadratic_regression(x, y)
     
     # The AIC values and the coefficients of the quadratic model are printed
     print(f"AIC for linear model: {aic_linear}")
     print(f"AIC for quadratic model: {aic_quadratic}")
-    print(f"Coefficients of quadratic model: {model_quadratic.params}")
+    print(f"Coefficients of quadratic model: {beta_quadratic}")
 
     # The data and the regression fits are plotted using the plot_data_and_fits method
-    analysis.plot_data_and_fits(x, y, model_linear, model_quadratic)
+    analysis.plot_data_and_fits(x, y, beta_linear, beta_quadratic)
 
 if __name__ == "__main__":
     main()
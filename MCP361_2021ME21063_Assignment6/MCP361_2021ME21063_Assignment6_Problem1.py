@@ -1,56 +1,71 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from numba import njit, prange
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _greedy_kernel(true_values, optimal_arms, time_steps, seed):
+    """
+    Full greedy-bandit simulation fused into one jit-compiled pass: each
+    bandit problem runs on its own thread (prange) with stack-local count
+    and estimate arrays, so the argmax + sample + incremental-mean update
+    chain never leaves compiled code. Returns per-problem reward and
+    optimal-action matrices for the caller to reduce.
+    """
+    num_iterations, num_arms = true_values.shape
+    rewards = np.empty((num_iterations, time_steps))
+    optimal = np.zeros((num_iterations, time_steps))
+    for iteration in prange(num_iterations):
+        np.random.seed(seed + iteration)  # Independent per-thread stream
+        counts = np.ones(num_arms)  # Each arm counts as initially pulled once
+        estimates = np.zeros(num_arms)
+        # Initial pull of every arm: only the rewards are recorded, the
+        # estimates stay at zero (as in the original formulation)
+        first = 0.0
+        for arm in range(num_arms):
+            first += np.random.normal(true_values[iteration, arm], 1.0)
+        rewards[iteration, 0] = first / num_arms
+        for step in range(1, time_steps):
+            # Greedy choice: manual scan beats allocating an argmax temp
+            arm = 0
+            best = estimates[0]
+            for a in range(1, num_arms):
+                if estimates[a] > best:
+                    best = estimates[a]
+                    arm = a
+            if arm == optimal_arms[iteration]:
+                optimal[iteration, step] = 1.0
+            reward = np.random.normal(true_values[iteration, arm], 1.0)
+            counts[arm] += 1.0
+            estimates[arm] += (reward - estimates[arm]) / counts[arm]
+            rewards[iteration, step] = reward
+    return rewards, optimal
 
 class MultiArmedBandit:
-    def __init__(self, num_arms, num_iterations, time_steps):
+    def __init__(self, num_arms, num_iterations, time_steps, seed=None):
         # Initialize the Multi-Armed Bandit problem
         self.num_arms = num_arms  # Number of arms in the bandit
         self.num_iterations = num_iterations  # Number of iterations for the simulation
         self.time_steps = time_steps  # Number of time steps for the simulation
         
+        # PCG64 generator: faster Gaussian draws than the lock-protected
+        # legacy global MT19937 stream, and seedable per instance
+        self.rng = np.random.default_rng(seed)
+        
         # Generate true values for each arm across all iterations
-        self.true_values = np.random.normal(0, 1, (num_iterations, num_arms))
+        self.true_values = self.rng.standard_normal((num_iterations, num_arms))
         # Determine the optimal arm for each iteration
         self.optimal_arms = np.argmax(self.true_values, axis=1)
         
     def run_simulation(self):
-        # Initialize the counts and estimated values for each arm
-        arm_counts = np.ones((self.num_iterations, self.num_arms))  # Each arm is initially pulled once
-        estimated_values = np.zeros((self.num_iterations, self.num_arms))  # Start with zero estimates
-        
-        # Perform the initial pull for each arm to generate initial rewards
-        rewards = np.random.normal(self.true_values, 1)
-        # Store the mean of the initial rewards
-        average_rewards = [np.mean(rewards)]
-        # Initialize percentage of optimal actions
-        optimal_action_percentage = [0]
+        # The whole (time_steps x num_iterations x num_arms) simulation runs
+        # inside the jit-compiled kernel; only the per-step reductions
+        # happen here
+        seed = int(self.rng.integers(1 << 30))  # Kernel streams derive from the instance generator
+        rewards, optimal = _greedy_kernel(self.true_values, self.optimal_arms, self.time_steps, seed)
         
-        # Run the simulation for each time step
-        for step in range(1, self.time_steps):
-            step_rewards = []  # List to store rewards for the current time step
-            optimal_actions = 0  # Counter for optimal actions
-            
-            # Iterate through each bandit problem
-            for iteration in range(self.num_iterations):
-                # Choose the arm with the highest estimated value
-                chosen_arm = np.argmax(estimated_values[iteration])
-                
-                # Check if the chosen arm is the optimal one
-                if chosen_arm == self.optimal_arms[iteration]:
-                    optimal_actions += 1  # Increment the count of optimal actions
-                    
-                # Generate reward for the chosen arm
-                reward = np.random.normal(self.true_values[iteration][chosen_arm], 1)
-                step_rewards.append(reward)
-                
-                # Update counts and estimated values for the chosen arm
-                arm_counts[iteration][chosen_arm] += 1
-                estimated_values[iteration][chosen_arm] += (reward - estimated_values[iteration][chosen_arm]) / arm_counts[iteration][chosen_arm]
-            
-            # Append the average reward for the current time step
-            average_rewards.append(np.mean(step_rewards))
-            # Append the percentage of optimal actions for the current time step
-            optimal_action_percentage.append(float(optimal_actions) / self.num_iterations * 100)
+        # Average reward and percentage of optimal actions per time step
+        average_rewards = rewards.mean(axis=0)
+        optimal_action_percentage = optimal.mean(axis=0) * 100
         
         return average_rewards, optimal_action_percentage
     
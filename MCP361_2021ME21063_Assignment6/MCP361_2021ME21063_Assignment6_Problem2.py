@@ -1,55 +1,70 @@
 import numpy as np
 import matplotlib.pyplot as plt
+from numba import njit, prange
+
+@njit(parallel=True, fastmath=True, cache=True)
+def _epsilon_greedy_kernel(true_values, optimal_arms, time_steps, epsilon, seed):
+    """
+    Full epsilon-greedy simulation fused into one jit-compiled pass: each
+    bandit problem runs on its own thread (prange) with stack-local count
+    and estimate arrays, so the explore/exploit choice, reward draw and
+    incremental-mean update never leave compiled code. Returns per-problem
+    reward and optimal-action matrices for the caller to reduce.
+    """
+    num_iterations, num_arms = true_values.shape
+    rewards = np.empty((num_iterations, time_steps))
+    optimal = np.zeros((num_iterations, time_steps))
+    for iteration in prange(num_iterations):
+        np.random.seed(seed + iteration)  # Independent per-thread stream
+        counts = np.zeros(num_arms)
+        estimates = np.zeros(num_arms)
+        for step in range(time_steps):
+            if np.random.random() < epsilon:
+                # Explore: choose a random arm
+                arm = np.random.randint(0, num_arms)
+            else:
+                # Exploit: manual argmax scan over the estimates
+                arm = 0
+                best = estimates[0]
+                for a in range(1, num_arms):
+                    if estimates[a] > best:
+                        best = estimates[a]
+                        arm = a
+            if arm == optimal_arms[iteration]:
+                optimal[iteration, step] = 1.0
+            reward = np.random.normal(true_values[iteration, arm], 1.0)
+            counts[arm] += 1.0
+            estimates[arm] += (reward - estimates[arm]) / counts[arm]
+            rewards[iteration, step] = reward
+    return rewards, optimal
 
 class EpsilonGreedyMAB:
-    def __init__(self, num_arms, num_iterations, time_steps):
+    def __init__(self, num_arms, num_iterations, time_steps, seed=None):
         # Initialize the Multi-Armed Bandit with epsilon-greedy strategy
         self.num_arms = num_arms  # Number of arms in the bandit
         self.num_iterations = num_iterations  # Number of iterations for the simulation
         self.time_steps = time_steps  # Number of time steps for the simulation
         
+        # PCG64 generator: faster Gaussian draws than the lock-protected
+        # legacy global MT19937 stream, and seedable per instance
+        self.rng = np.random.default_rng(seed)
+        
         # Generate true values for each arm across all iterations
-        self.true_values = np.random.normal(0, 1, (num_iterations, num_arms))
+        self.true_values = self.rng.standard_normal((num_iterations, num_arms))
         # Determine the optimal arm for each iteration
         self.optimal_arms = np.argmax(self.true_values, axis=1)
         
     def run_simulation(self, epsilon):
-        # Initialize arrays for tracking arm pulls and estimated values
-        arm_counts = np.zeros((self.num_iterations, self.num_arms))  # Initialize pull counts to zero
-        estimated_values = np.zeros((self.num_iterations, self.num_arms))  # Initialize estimated values to zero
-        
-        average_rewards = []  # List to store average rewards over time
-        optimal_action_percentage = []  # List to store percentage of optimal actions over time
+        # The whole (time_steps x num_iterations x num_arms) simulation runs
+        # inside the jit-compiled kernel (the per-problem counts and
+        # estimates live on its threads); only the per-step reductions
+        # happen here
+        seed = int(self.rng.integers(1 << 30))  # Kernel streams derive from the instance generator
+        rewards, optimal = _epsilon_greedy_kernel(self.true_values, self.optimal_arms, self.time_steps, epsilon, seed)
         
-        for step in range(self.time_steps):
-            step_rewards = []  # List to store rewards for the current time step
-            optimal_actions = 0  # Counter for the number of optimal actions
-            
-            for iteration in range(self.num_iterations):
-                # Decide whether to explore or exploit based on epsilon
-                if np.random.random() < epsilon:
-                    # Explore: choose a random arm
-                    chosen_arm = np.random.randint(self.num_arms)
-                else:
-                    # Exploit: choose the arm with the highest estimated value
-                    chosen_arm = np.argmax(estimated_values[iteration])
-                
-                # Check if the chosen arm is the optimal arm
-                if chosen_arm == self.optimal_arms[iteration]:
-                    optimal_actions += 1  # Increment the count of optimal actions
-                    
-                # Generate a reward for the chosen arm
-                reward = np.random.normal(self.true_values[iteration][chosen_arm], 1)
-                step_rewards.append(reward)  # Store the reward
-                
-                # Update the counts and estimated values for the chosen arm
-                arm_counts[iteration][chosen_arm] += 1
-                estimated_values[iteration][chosen_arm] += (reward - estimated_values[iteration][chosen_arm]) / arm_counts[iteration][chosen_arm]
-            
-            # Compute and store the average reward for the current time step
-            average_rewards.append(np.mean(step_rewards))
-            # Compute and store the percentage of optimal actions for the current time step
-            optimal_action_percentage.append(float(optimal_actions) / self.num_iterations * 100)
+        # Average reward and percentage of optimal actions per time step
+        average_rewards = rewards.mean(axis=0)
+        optimal_action_percentage = optimal.mean(axis=0) * 100
         
         return average_rewards, optimal_action_percentage
     
@@ -67,11 +82,16 @@ class EpsilonGreedyMAB:
         # Create subplots for average rewards and percentage of optimal actions
         fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(15, 6))
         
-        for epsilon, (avg_rewards, opt_action_pct) in results.items():
-            # Plot average rewards for each epsilon
-            ax1.plot(avg_rewards, label=f'ε = {epsilon}')
-            # Plot percentage of optimal actions for each epsilon
-            ax2.plot(opt_action_pct, label=f'ε = {epsilon}')
+        # Stack the per-epsilon curves into (time_steps, n_epsilons) arrays
+        # so each axis gets a single plot call — matplotlib makes one Line2D
+        # per column, skipping the per-epsilon artist-setup loop
+        epsilons = list(results)
+        avg_rewards = np.column_stack([results[epsilon][0] for epsilon in epsilons])
+        opt_action_pct = np.column_stack([results[epsilon][1] for epsilon in epsilons])
+        for line, epsilon in zip(ax1.plot(avg_rewards), epsilons):
+            line.set_label(f'ε = {epsilon}')
+        for line, epsilon in zip(ax2.plot(opt_action_pct), epsilons):
+            line.set_label(f'ε = {epsilon}')
         
         # Set titles and labels for the plots
         ax1.set_title("Average Rewards for ε-Greedy")
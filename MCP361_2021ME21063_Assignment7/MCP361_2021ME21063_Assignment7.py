@@ -1,75 +1,67 @@
+import concurrent.futures
+
+import numpy as np
+
 def load_game_data(file_path):
-    # Open the file and read all lines
+    # Read the whole file once; with commas normalized to whitespace the
+    # payoffs form one flat token stream that numpy converts in a single
+    # pass — no per-cell Python lists or float() calls
     with open(file_path, 'r') as file:
-        lines = file.readlines()
+        lines = [line for line in file.read().splitlines() if line.strip()]
     
-    game_data = []
-    # Process each line to extract game data
-    for line in lines:
-        rows = line.strip().split()
-        # Convert each cell from string to a list of floats
-        game_data.append([list(map(float, cell.split(','))) for cell in rows])
-    
-    return game_data
+    flat = np.array(' '.join(lines).replace(',', ' ').split(), dtype=float)
+    # Shape (rows, cols, 2): payoff for player 1 and player 2 per cell
+    return flat.reshape(len(lines), -1, 2)
 
 def determine_optimal_strategies(game_data, response_matrix):
-    num_rows = len(game_data)  # Number of strategies for Player 1
-    num_cols = len(game_data[0])  # Number of strategies for Player 2
-
-    # Determine optimal strategies for Player 2
-    for r in range(num_rows):
-        # Find the maximum payoff for Player 2 in the current row
-        max_payoff_player2 = max(cell[1] for cell in game_data[r])
-        for c in range(num_cols):
-            # If current cell has the maximum payoff for Player 2, mark it in the response matrix
-            if game_data[r][c][1] == max_payoff_player2:
-                response_matrix[r][c][1] = 1
+    # Player 2 best-responds within each row and player 1 within each
+    # column; both reduce to one vectorized max-and-compare pass instead of
+    # nested Python loops over every cell. The two flags are packed into
+    # one uint8 plane: bit 0 marks player 1, bit 1 marks player 2.
+    payoffs_player1 = game_data[:, :, 0]
+    response_matrix |= payoffs_player1 == payoffs_player1.max(axis=0, keepdims=True)
 
-    # Determine optimal strategies for Player 1
-    for c in range(num_cols):
-        # Find the maximum payoff for Player 1 in the current column
-        max_payoff_player1 = max(game_data[r][c][0] for r in range(num_rows))
-        for r in range(num_rows):
-            # If current cell has the maximum payoff for Player 1, mark it in the response matrix
-            if game_data[r][c][0] == max_payoff_player1:
-                response_matrix[r][c][0] = 1
+    payoffs_player2 = game_data[:, :, 1]
+    response_matrix |= (payoffs_player2 == payoffs_player2.max(axis=1, keepdims=True)).astype(np.uint8) << 1
 
 def find_and_display_nash_equilibria(game_data, response_matrix, file_path):
-    rows, cols = len(game_data), len(game_data[0])  # Get dimensions of the game data
-    print(f"\n{file_path}\n{'-'*45}")  # Indicate which file is being processed with a separator
-    found_equilibrium = False  # Flag to track if any Nash Equilibrium is found
+    # The report is assembled as one string and returned, so files solved
+    # concurrently can still be printed atomically and in input order
+    lines = [f"\n{file_path}\n{'-'*45}"]  # Indicate which file is being processed with a separator
     
-    # Iterate through all cells to find Nash Equilibria
-    for r in range(rows):
-        for c in range(cols):
-            # Check if both players' strategies are optimal at this cell
-            if response_matrix[r][c][0] == 1 and response_matrix[r][c][1] == 1:
-                print(f"Player 1 chooses strategy {r+1} and Player 2 chooses strategy {c+1}")  # Output the equilibrium with clear formatting
-                found_equilibrium = True
+    # A Nash equilibrium is any cell with both best-response bits set; one
+    # compare against the packed mask finds them all in row-major order
+    eq_rows, eq_cols = np.where(response_matrix == 0b11)
+    for r, c in zip(eq_rows, eq_cols):
+        lines.append(f"Player 1 chooses strategy {r+1} and Player 2 chooses strategy {c+1}")  # Output the equilibrium with clear formatting
     
-    # If no Nash Equilibrium was found, print a message
-    if not found_equilibrium:
-        print("No Nash Equilibrium identified.")
-    print(f"{'-'*45}\n")  # End with a separator for clarity
+    # If no Nash Equilibrium was found, report that instead
+    if eq_rows.size == 0:
+        lines.append("No Nash Equilibrium identified.")
+    lines.append(f"{'-'*45}\n")  # End with a separator for clarity
+    return "\n".join(lines)
 
 
 def process_game_file(file_path):
     # Load the game data from the specified file
     game_data = load_game_data(file_path)
-    rows, cols = len(game_data), len(game_data[0])  # Get the dimensions of the game data
-    # Initialize a response matrix to track optimal strategies
-    response_matrix = [[[0, 0] for _ in range(cols)] for _ in range(rows)]
+    rows, cols = game_data.shape[:2]  # Get the dimensions of the game data
+    # Initialize a packed response plane to track optimal strategies
+    response_matrix = np.zeros((rows, cols), dtype=np.uint8)
     
     # Determine the optimal strategies for both players
     determine_optimal_strategies(game_data, response_matrix)
     
-    # Find and display the Nash Equilibria based on the response matrix
-    find_and_display_nash_equilibria(game_data, response_matrix, file_path)
+    # Build the Nash Equilibria report from the response matrix
+    return find_and_display_nash_equilibria(game_data, response_matrix, file_path)
 
 def process_multiple_files(file_list):
-    # Process each file in the provided list of game files
-    for file in file_list:
-        process_game_file(file)
+    # The game files are independent, so parse and solve them concurrently;
+    # each worker returns its report and printing happens here in input
+    # order, keeping the output deterministic
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(file_list)) as executor:
+        for report in executor.map(process_game_file, file_list):
+            print(report)
 
 def main():
     # List of game files to process
@@ -1,100 +1,144 @@
+import ast
+import hashlib
+from collections import deque
+
 import networkx as nx
 import matplotlib.pyplot as plt
-
-class TreeNode:
-    def __init__(self, node_id, player, children, payoff):
-        self.node_id = node_id  # Unique identifier for the node
-        self.player = player  # Player making the decision at this node
-        self.children = children  # List of child nodes [left_child, right_child]
-        self.payoff = payoff  # Payoff vector for terminal nodes
+import numpy as np
+
+def _parse_payoff(token):
+    # Payoff tokens are almost always comma-separated ints in brackets;
+    # splitting by hand skips AST construction for that shape, with
+    # ast.literal_eval kept as the safe fallback for anything else
+    if token == '[]':
+        return []
+    try:
+        return [int(part) for part in token[1:-1].split(',')]
+    except ValueError:
+        return ast.literal_eval(token)
 
 def load_tree_from_file(filepath):
-    tree = {}
+    # One read feeds both parses: each line splits at its '[' into the
+    # integer head and the payoff token, and the heads concatenate into a
+    # single token stream that one C-level numpy call converts (replacing
+    # four int() conversions per line)
     with open(filepath, 'r') as file:
-        for line in file:
-            data = line.strip().split()  # Split the line into components
-            node_id = int(data[0])  # Node ID
-            player = int(data[1]) if int(data[1]) != -1 else None  # Player number (or None if no player)
-            children = [int(c) if int(c) != -1 else None for c in data[2:4]]  # Child node IDs
-            payoff = eval(data[4]) if data[4] != '[]' else [0, 0]  # Evaluate payoff as a list or default
-            tree[node_id] = TreeNode(node_id, player, children, payoff)  # Create and store the node
-    return tree  # Return the constructed game tree
+        splits = [line.split('[', 1) for line in file if line.strip()]
+    ints = np.array(' '.join(head for head, _ in splits).split(), dtype=np.int32).reshape(-1, 4)
+    payoff_tokens = ['[' + tail.rstrip() for _, tail in splits]
+
+    # Structure-of-arrays layout: one flat array per field instead of a
+    # dict of per-node objects, so traversals read contiguous int buffers
+    # rather than chasing object and list pointers. Missing players and
+    # children keep the -1 sentinel from the input format, and terminal
+    # nodes are flagged explicitly instead of inferred from a [0, 0]
+    # payoff placeholder.
+    parsed_payoffs = [_parse_payoff(token) for token in payoff_tokens]  # Parse payoff tokens
+    node_count = int(ints[:, 0].max()) + 1
+    payoff_width = max(len(payoff) for payoff in parsed_payoffs)  # Payoff vector length (one entry per player)
+    players = np.full(node_count, -1, dtype=np.int8)
+    children = np.full((node_count, 2), -1, dtype=np.int32)
+    payoffs = np.zeros((node_count, payoff_width), dtype=np.int32)
+    is_terminal = np.zeros(node_count, dtype=np.bool_)
+    for (node_id, player, left, right), payoff in zip(ints.tolist(), parsed_payoffs):
+        players[node_id] = player
+        children[node_id] = (left, right)
+        if payoff:
+            payoffs[node_id] = payoff
+            is_terminal[node_id] = True
+    return players, children, payoffs, is_terminal  # Return the constructed game tree
+
+_DEPTH_CACHE = {}
+
+def _node_depths(children):
+    # The depth pass depends only on the tree structure, so it is cached
+    # on a digest of the children array; reprocessing the same file in a
+    # session (or the same structure across runs of main) skips the BFS
+    key = hashlib.blake2b(children.tobytes()).digest()
+    cached = _DEPTH_CACHE.get(key)
+    if cached is None:
+        depth = np.full(children.shape[0], -1, dtype=np.int32)
+        frontier = np.array([0], dtype=np.int32)
+        level_count = 0
+        while frontier.size:
+            depth[frontier] = level_count
+            frontier = children[frontier].ravel()
+            frontier = frontier[frontier >= 0]
+            level_count += 1
+        cached = _DEPTH_CACHE[key] = (depth, level_count)
+    return cached
 
 def backward_induction_algorithm(tree):
-    optimal_strategy = {}  # Dictionary to store optimal moves for each node
-
-    def recursive_evaluation(node_id):
-        node = tree[node_id]  # Get the current node
-        if node.payoff != [0, 0]:  # Check if it's a terminal node (non-terminal nodes should have initial payoffs as [0,0])
-            return node.payoff  # Return the payoff for terminal nodes
-        else:
-            # Recursively get the payoffs from the child nodes
-            left_payoff = recursive_evaluation(node.children[0])  # Payoff from left child
-            right_payoff = recursive_evaluation(node.children[1])  # Payoff from right child
-            
-            # Decision logic based on the current player's strategy
-            if node.player == 1:  # Player 1 maximizes the first element of the payoff
-                if left_payoff[0] >= right_payoff[0]:
-                    optimal_strategy[node.node_id] = node.children[0]  # Select left child
-                    node.payoff = left_payoff  # Update current node's payoff
-                else:
-                    optimal_strategy[node.node_id] = node.children[1]  # Select right child
-                    node.payoff = right_payoff  # Update current node's payoff
-            else:  # For Player 2 and subsequent players
-                if left_payoff[1] >= right_payoff[1]:  # Compare second payoff
-                    optimal_strategy[node.node_id] = node.children[0]  # Select left child
-                    node.payoff = left_payoff  # Update current node's payoff
-                else:
-                    optimal_strategy[node.node_id] = node.children[1]  # Select right child
-                    node.payoff = right_payoff  # Update current node's payoff
-
-            return node.payoff  # Return the updated payoff for this node
-
-    recursive_evaluation(0)  # Start evaluation from the root node
-    return optimal_strategy  # Return the computed strategy
+    players, children, payoffs, is_terminal = tree
+    node_count = players.shape[0]
+    strategy = np.full(node_count, -1, dtype=np.int32)  # -1 marks nodes without a move
+
+    # One BFS pass from the root assigns every node its depth (cached per
+    # tree structure); nodes at the same depth are independent, so the
+    # evaluation walks the levels from the leaves up and resolves each
+    # whole level as one vectorized compare-and-select instead of one
+    # Python branch per node
+    depth, level_count = _node_depths(children)
+
+    rows = np.arange(node_count)
+    for level in range(level_count - 1, -1, -1):
+        idx = np.flatnonzero((depth == level) & ~is_terminal & (children[:, 0] >= 0))
+        if idx.size == 0:  # Level holds only terminal nodes
+            continue
+        left_payoffs = payoffs[children[idx, 0]]  # Payoffs from left children
+        right_payoffs = payoffs[children[idx, 1]]  # Payoffs from right children
+        # Player 1 maximizes the first payoff element, Player 2 the second
+        columns = np.where(players[idx] == 1, 0, 1)
+        pick_left = left_payoffs[rows[:idx.size], columns] >= right_payoffs[rows[:idx.size], columns]
+        payoffs[idx] = np.where(pick_left[:, None], left_payoffs, right_payoffs)  # Propagate the chosen payoffs upward
+        strategy[idx] = np.where(pick_left, children[idx, 0], children[idx, 1])  # Record the optimal moves
+
+    return strategy  # Return the computed strategy
 
 def draw_tree(tree, strategy):
+    players, children, payoffs, is_terminal = tree
     graph = nx.Graph()
-    node_count = len(tree)
+    node_count = players.shape[0]
     graph.add_nodes_from(range(node_count))  # Add nodes to the graph
 
-    edges = []
-    for i in range(node_count):
-        if tree[i].children[0] is not None:
-            edges.append((i, tree[i].children[0]))  # Add edge to left child
-        if tree[i].children[1] is not None:
-            edges.append((i, tree[i].children[1]))  # Add edge to right child
+    # Edges and their player labels come out of one pass over the
+    # children array: the masks select the real child slots, and the
+    # parent/child index pairs feed both the graph and the label dict
+    left_mask = children[:, 0] >= 0
+    right_mask = children[:, 1] >= 0
+    edges = (list(zip(np.flatnonzero(left_mask).tolist(), children[left_mask, 0].tolist()))
+             + list(zip(np.flatnonzero(right_mask).tolist(), children[right_mask, 1].tolist())))
+    edge_labels = {(parent, child): f"Player {players[parent]}"
+                   for parent, child in edges if players[parent] >= 0}
     graph.add_edges_from(edges)  # Add edges to the graph
 
-    # Define positions for the nodes to create a tree structure
+    # Define positions for the nodes to create a tree structure. The
+    # layout walks the tree breadth-first with an explicit queue, so
+    # arbitrarily deep trees position without Python recursion
     pos = {}
-    def position_nodes(node_id, x, y, layer):
+    _, level_count = _node_depths(children)
+    inv_levels = np.reciprocal(np.arange(1, level_count + 2, dtype=np.float64))  # inv_levels[layer] == 1 / (layer + 1), one division per layer instead of two per node
+    queue = deque([(0, 0.0, 0, 1)])  # (node, x, y, layer), starting from the root
+    while queue:
+        node_id, x, y, layer = queue.popleft()
         pos[node_id] = (x, y)  # Assign position to the node
-        if tree[node_id].children[0] is not None:
-            position_nodes(tree[node_id].children[0], x - 1 / (layer + 1), y - 1, layer + 1)  # Left child
-        if tree[node_id].children[1] is not None:
-            position_nodes(tree[node_id].children[1], x + 1 / (layer + 1), y - 1, layer + 1)  # Right child
-
-    position_nodes(0, 0, 0, 1)  # Start positioning from the root node
+        left, right = children[node_id].tolist()
+        dx = inv_levels[layer]  # Horizontal offset for this layer
+        if left >= 0:
+            queue.append((left, x - dx, y - 1, layer + 1))  # Left child
+        if right >= 0:
+            queue.append((right, x + dx, y - 1, layer + 1))  # Right child
 
     plt.figure(figsize=(12, 8))
-    
+
     # Draw the nodes
     nx.draw(graph, pos, with_labels=True, node_shape='s', node_color='lightblue', font_size=10, font_weight='bold')
 
     # Draw edges
-    edge_labels = {}
-    for i in range(node_count):
-        if tree[i].player is not None:
-            if tree[i].children[0] is not None:
-                edge_labels[(i, tree[i].children[0])] = f"Player {tree[i].player}"
-            if tree[i].children[1] is not None:
-                edge_labels[(i, tree[i].children[1])] = f"Player {tree[i].player}"
-
     nx.draw_networkx_edge_labels(graph, pos, edge_labels=edge_labels)
 
     # Add payoffs to the nodes
-    node_labels = {i: f"\nPayoff: {tuple(tree[i].payoff)}" for i in range(node_count)}
+    node_labels = {i: f"\nPayoff: {tuple(payoffs[i].tolist())}" for i in range(node_count)}
     for i in range(node_count):
         plt.text(pos[i][0], pos[i][1], f"{node_labels[i]}", fontsize=10, ha='center', va='center', color='black')
 